@@ -0,0 +1,12 @@
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+
+from .models import Building
+from .utils import invalidate_building_ids
+
+
+@receiver(post_save, sender=Building)
+@receiver(post_delete, sender=Building)
+def building_ids_changed(sender, instance, **kwargs):
+    """Keep the cached building id set in sync with creates and deletes"""
+    invalidate_building_ids()
@@ -0,0 +1,65 @@
+from django.conf import settings
+from django.core.cache import cache
+
+from .models import Building
+
+BUILDING_IDS_CACHE_KEY = 'building_mgmt:building_ids'
+BUILDING_IDS_CACHE_TIMEOUT = 3600
+
+# Backends whose contents are private to one process (or not kept at all)
+LOCAL_CACHE_BACKENDS = frozenset({
+    'django.core.cache.backends.locmem.LocMemCache',
+    'django.core.cache.backends.dummy.DummyCache',
+})
+
+
+def cache_is_shared():
+    """Whether the default cache is shared between worker processes"""
+    return settings.CACHES['default']['BACKEND'] not in LOCAL_CACHE_BACKENDS
+
+
+def get_building_ids():
+    """
+    Set of all building ids, cached.
+
+    Invalidated by the Building post_save/post_delete signals (see signals.py).
+    """
+    return cache.get_or_set(
+        BUILDING_IDS_CACHE_KEY,
+        lambda: set(Building.objects.values_list('id', flat=True)),
+        BUILDING_IDS_CACHE_TIMEOUT
+    )
+
+
+def invalidate_building_ids():
+    """Drop the cached building id set"""
+    cache.delete(BUILDING_IDS_CACHE_KEY)
+
+
+def get_missing_building_ids(building_ids):
+    """
+    Return the ids in building_ids that do not belong to any building.
+
+    The cached id set is only used with a shared cache backend; a local one
+    would keep buildings deleted by other processes. Ids missing from the
+    cached set are confirmed against the database, and the cache refreshed
+    when one is found. Writers should still handle IntegrityError, as a
+    delete can land between this check and their INSERT.
+    """
+    building_ids = set(building_ids)
+    if not cache_is_shared():
+        found = set(Building.objects.filter(id__in=building_ids).values_list('id', flat=True))
+        return building_ids - found
+
+    missing = building_ids - get_building_ids()
+    if missing:
+        found = set(Building.objects.filter(id__in=missing).values_list('id', flat=True))
+        if found:
+            invalidate_building_ids()
+        missing -= found
+    return missing
+
+
+def building_exists(building_id):
+    """Whether a building with this id exists, without a query on a shared cache hit"""
+    return not get_missing_building_ids([building_id])
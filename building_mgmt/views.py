@@ -7,6 +7,7 @@ from rest_framework.decorators import api_view, permission_classes
 from rest_framework.permissions import IsAuthenticated, AllowAny
 from .models import Building, Tower, Unit
 from .serializers import BuildingSerializer, BuildingReadSerializer, UnitSerializer, UnitDetailSerializer, BuildingBasicSerializer
+from reporting.utils import invalidate_report_cache
 from openpyxl import Workbook
 from openpyxl.styles import Font, Alignment, PatternFill, Border, Side
 from openpyxl.utils import get_column_letter
@@ -839,6 +840,8 @@ def import_units_excel(request, id):
                     print(f"DEBUG: Bulk creating {len(units_to_bulk_create)} units")
                     # Use bulk_create with batch_size to avoid memory issues
                     created_batch = Unit.objects.bulk_create(units_to_bulk_create, batch_size=10)
+                    # bulk_create sends no post_save signals
+                    invalidate_report_cache()
                     created_units.extend(created_batch)
                     create_count += len(created_batch)
                     print(f"DEBUG: Successfully bulk created {len(created_batch)} units")
@@ -6,6 +6,7 @@ from django.http import HttpResponse
 from .models import ConsumptionRegister, ConsumptionAccount, SubAccount
 from .serializers import ConsumptionRegisterSerializer, ConsumptionAccountSerializer, SubAccountSerializer
 from building_mgmt.models import Building
+from reporting.utils import invalidate_report_cache
 import openpyxl
 from openpyxl import Workbook
 from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
@@ -747,6 +748,8 @@ def import_consumption_excel(request):
             try:
                 ConsumptionRegister.objects.bulk_create(new_registers, batch_size=100)
                 created_count = len(new_registers)
+                # bulk_create sends no post_save signals
+                invalidate_report_cache()
             except Exception as e:
                 # Fallback to individual saves
                 for register in new_registers:
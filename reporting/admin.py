@@ -1,5 +1,5 @@
 from django.contrib import admin
-from .models import ReportTemplate, GeneratedReport, ReportSchedule, ReportAccess, ReportJustification
+from .models import ReportTemplate, GeneratedReport, ReportSchedule, ReportAccess, ReportJustification, ReportTask
 
 
 @admin.register(ReportTemplate)
@@ -35,3 +35,10 @@ class ReportJustificationAdmin(admin.ModelAdmin):
     list_display = ['building', 'updated_by', 'updated_at']
     search_fields = ['building__building_name']
     readonly_fields = ['created_at', 'updated_at']
+
+
+@admin.register(ReportTask)
+class ReportTaskAdmin(admin.ModelAdmin):
+    list_display = ['task_id', 'building', 'requested_by', 'filename', 'created_at']
+    search_fields = ['task_id', 'building__building_name']
+    readonly_fields = ['created_at']
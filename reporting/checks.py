@@ -0,0 +1,17 @@
+from importlib.util import find_spec
+
+from django.core.checks import Warning, register
+
+
+@register()
+def check_rl_accel(app_configs, **kwargs):
+    """ReportLab picks up its C text-width and PDF escaping routines from rl_accel when installed"""
+    if find_spec('rl_accel') is None:
+        return [
+            Warning(
+                'rl_accel is not installed, ReportLab falls back to its slower pure-Python routines.',
+                hint="Install ReportLab with the accelerator: pip install 'reportlab[accel]'.",
+                id='reporting.W001',
+            )
+        ]
+    return []
@@ -187,4 +187,26 @@ class ReportJustification(models.Model):
 
     class Meta:
         verbose_name = 'Report Justification'
-        verbose_name_plural = 'Report Justifications'
\ No newline at end of file
+        verbose_name_plural = 'Report Justifications'
+
+class ReportTask(models.Model):
+    """
+    A report PDF being built in the background by the build_report_pdf task.
+
+    Records who queued it, so only they can poll its status and download it.
+    """
+    task_id = models.CharField(max_length=255, unique=True)
+    building = models.ForeignKey(Building, on_delete=models.CASCADE, related_name='report_tasks')
+    requested_by = models.ForeignKey(User, on_delete=models.CASCADE, related_name='report_tasks')
+
+    # Set by the task once the PDF has been saved
+    report_file = models.FileField(upload_to='reports/', null=True, blank=True)
+    filename = models.CharField(max_length=255, blank=True, default='')
+
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    def __str__(self):
+        return f"Report task {self.task_id} - {self.building.building_name}"
+
+    class Meta:
+        ordering = ['-created_at']
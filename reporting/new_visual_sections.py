@@ -5,12 +5,13 @@ from reportlab.lib.units import inch
 from reportlab.platypus import PageBreak, Spacer
 from django.db.models import Sum
 
-# Import helper functions from main views
-from reporting.views import (
+# Shared chart and text flowables
+from reporting.pdf_elements import (
     create_section_header,
     create_subsection_header,
     create_normal_paragraph,
-    create_chart
+    create_chart,
+    borrow_figure,
 )
 
 
@@ -156,30 +157,26 @@ def generate_financial_charts(building, start_date, end_date):
                 actual_values = [float(m.get('actualAmount', 0)) for m in monthly_records]
 
                 # Create a dual-series line chart manually using matplotlib
-                import matplotlib
-                matplotlib.use('Agg')
-                matplotlib.rcParams['font.family'] = 'DejaVu Sans'
-                matplotlib.rcParams['axes.unicode_minus'] = False
-                import matplotlib.pyplot as plt
                 from io import BytesIO
                 from reportlab.platypus import Image
 
-                fig, ax = plt.subplots(figsize=(6, 3), dpi=100)
-                ax.plot(chart_months, expected_values, color='#10b981', linewidth=2, marker='o', label='Expected')
-                ax.plot(chart_months, actual_values, color='#ef4444', linewidth=2, marker='o', label='Actual')
-                ax.set_xlabel('Month')
-                ax.set_ylabel('Amount (R$)')
-                ax.set_title(f'{account_code} - Monthly Performance')
-                ax.legend()
-                ax.grid(True, alpha=0.3)
-                plt.xticks(rotation=45, ha='right')
-                plt.tight_layout()
-
-                # Convert to image
-                img_buffer = BytesIO()
-                fig.savefig(img_buffer, format='png', bbox_inches='tight')
-                img_buffer.seek(0)
-                plt.close(fig)
+                with borrow_figure((6, 3)) as fig:
+                    ax = fig.subplots()
+                    ax.plot(chart_months, expected_values, color='#10b981', linewidth=2, marker='o', label='Expected')
+                    ax.plot(chart_months, actual_values, color='#ef4444', linewidth=2, marker='o', label='Actual')
+                    ax.set_xlabel('Month')
+                    ax.set_ylabel('Amount (R$)')
+                    ax.set_title(f'{account_code} - Monthly Performance')
+                    ax.legend()
+                    ax.grid(True, alpha=0.3)
+                    for label in ax.get_xticklabels():
+                        label.set(rotation=45, ha='right')
+                    fig.tight_layout()
+
+                    # Convert to image
+                    img_buffer = BytesIO()
+                    fig.savefig(img_buffer, format='png', bbox_inches='tight')
+                    img_buffer.seek(0)
 
                 img = Image(img_buffer, width=6*inch, height=3*inch)
                 elements.append(img)
@@ -190,8 +187,9 @@ def generate_financial_charts(building, start_date, end_date):
     # ==================================================================
     units = Unit.objects.filter(building=building)
     accounts = FinancialMainAccount.objects.filter(building=building)
+    total_units = units.count()
 
-    if units.exists() and accounts.exists():
+    if total_units and accounts.exists():
         try:
             market_settings = MarketValueSetting.objects.get(building=building)
 
@@ -235,7 +233,7 @@ def generate_financial_charts(building, start_date, end_date):
             # Summary stats
             elements.append(create_normal_paragraph(
                 f"<b>Total Monthly Collection:</b> R$ {ordinary_budget:,.2f} | "
-                f"<b>Total Units:</b> {units.count()} | "
+                f"<b>Total Units:</b> {total_units} | "
                 f"<b>Avg Condo Fee/m²:</b> R$ {avg_condo_fee_per_m2:.2f}"
             ))
             elements.append(Spacer(1, 0.2*inch))
@@ -349,9 +347,9 @@ def generate_financial_charts(building, start_date, end_date):
             elements.append(table)
             elements.append(Spacer(1, 0.2*inch))
 
-            if units.count() > 50:
+            if total_units > 50:
                 elements.append(create_normal_paragraph(
-                    f"<i>Note: Showing first 50 units of {units.count()} total units.</i>"
+                    f"<i>Note: Showing first 50 units of {total_units} total units.</i>"
                 ))
 
         except MarketValueSetting.DoesNotExist:
@@ -368,6 +366,8 @@ def generate_consumption_charts(building, start_date, end_date):
     Focus: Consumption vs Payments comparison
     """
     from consumptions.models import ConsumptionRegister, ConsumptionAccount
+    from django.db.models.functions import TruncMonth
+    from collections import defaultdict
     from datetime import datetime
 
     elements = []
@@ -393,24 +393,24 @@ def generate_consumption_charts(building, start_date, end_date):
         month__lte=end_month
     ).order_by('month')
 
-    # Chart 1: Consumption vs Payments by Utility Type
-    for utility_type in ['water', 'electricity', 'gas']:
-        utility_registers = registers.filter(utility_type=utility_type)
-        utility_accounts = accounts.filter(utility_type=utility_type)
-
-        if utility_registers.exists() or utility_accounts.exists():
-            # Aggregate by month
-            from collections import defaultdict
-            monthly_consumption = defaultdict(float)
-            monthly_payments = defaultdict(float)
+    # Monthly (utility, month) totals straight from the database, no model instances
+    consumption_by_utility = defaultdict(dict)
+    for utility_type, month, total in registers.order_by().annotate(
+        month_start=TruncMonth('date')
+    ).values_list('utility_type', 'month_start').annotate(total=Sum('value')):
+        consumption_by_utility[utility_type][month.strftime('%Y-%m')] = float(total)
 
-            for reg in utility_registers:
-                month_key = reg.date.strftime('%Y-%m')
-                monthly_consumption[month_key] += float(reg.value)
+    # Later rows for the same month win, as before
+    payments_by_utility = defaultdict(dict)
+    for utility_type, month, amount in accounts.values_list('utility_type', 'month', 'amount'):
+        payments_by_utility[utility_type][month] = float(amount)
 
-            for acc in utility_accounts:
-                monthly_payments[acc.month] = float(acc.amount)
+    # Chart 1: Consumption vs Payments by Utility Type
+    for utility_type in ['water', 'electricity', 'gas']:
+        monthly_consumption = consumption_by_utility.get(utility_type, {})
+        monthly_payments = payments_by_utility.get(utility_type, {})
 
+        if monthly_consumption or monthly_payments:
             # Get all months
             all_months = sorted(set(list(monthly_consumption.keys()) + list(monthly_payments.keys())))
 
@@ -447,6 +447,7 @@ def generate_legal_visual(building, start_date, end_date):
     Includes: LegalObligation, LegalTemplate, and LegalObligationCompletion data
     """
     from legal_docs.models import LegalObligation, LegalTemplate, LegalObligationCompletion
+    from django.db.models import Count, Max, Min
 
     elements = []
 
@@ -471,7 +472,33 @@ def generate_legal_visual(building, start_date, end_date):
             active=True
         ).order_by('name')
 
-    total_items = obligations.count() + templates.count()
+    # Charts only need (label, count) pairs, so they are counted in the database
+    # and labelled from the field choices instead of walking model instances
+    obligation_status_display = dict(LegalObligation._meta.get_field('status').choices)
+    obligation_type_display = dict(LegalObligation._meta.get_field('obligation_type').choices)
+    template_status_display = dict(LegalTemplate._meta.get_field('status').choices)
+
+    # Statuses in order of first appearance under '-due_date'
+    status_counts = {
+        row['status']: row['status_count']
+        for row in obligations.order_by().values('status').annotate(
+            status_count=Count('id'),
+            latest=Max('due_date'),
+        ).order_by('-latest')
+    }
+    total_obligations = sum(status_counts.values())
+
+    # Template statuses in order of first appearance under 'name'
+    template_status_counts = {
+        row['status']: row['status_count']
+        for row in templates.order_by().values('status').annotate(
+            status_count=Count('id'),
+            first_name=Min('name'),
+        ).order_by('first_name')
+    }
+    total_templates = sum(template_status_counts.values())
+
+    total_items = total_obligations + total_templates
 
     if total_items == 0:
         elements.append(create_normal_paragraph(
@@ -480,15 +507,13 @@ def generate_legal_visual(building, start_date, end_date):
         return elements
 
     # Chart 1: LegalObligation Status Distribution
-    if obligations.exists():
+    if total_obligations:
         elements.append(create_subsection_header('Legal Obligations by Status'))
 
-        status_counts = {}
-        for obl in obligations:
-            status_display = obl.get_status_display()
-            status_counts[status_display] = status_counts.get(status_display, 0) + 1
-
-        chart_data = [(status, count) for status, count in status_counts.items()]
+        chart_data = [
+            (obligation_status_display.get(status, status), count)
+            for status, count in status_counts.items()
+        ]
         chart = create_chart('pie', chart_data,
                            'Obligation Status Distribution',
                            '', '',
@@ -497,13 +522,13 @@ def generate_legal_visual(building, start_date, end_date):
         elements.append(Spacer(1, 0.2*inch))
 
         # Status Summary
-        pending = obligations.filter(status='pending').count()
-        in_progress = obligations.filter(status='in_progress').count()
-        completed = obligations.filter(status='completed').count()
-        overdue = obligations.filter(status='overdue').count()
+        pending = status_counts.get('pending', 0)
+        in_progress = status_counts.get('in_progress', 0)
+        completed = status_counts.get('completed', 0)
+        overdue = status_counts.get('overdue', 0)
 
         elements.append(create_normal_paragraph(
-            f"<b>Total Obligations:</b> {obligations.count()} | "
+            f"<b>Total Obligations:</b> {total_obligations} | "
             f"<b>Pending:</b> {pending} | "
             f"<b>In Progress:</b> {in_progress} | "
             f"<b>Completed:</b> {completed} | "
@@ -519,16 +544,14 @@ def generate_legal_visual(building, start_date, end_date):
             elements.append(Spacer(1, 0.2*inch))
 
     # Chart 2: LegalTemplate Status Distribution
-    if templates.exists():
+    if total_templates:
         elements.append(create_subsection_header('Template-Based Obligations'))
 
-        template_status_counts = {}
-        for tmpl in templates:
-            status_display = tmpl.get_status_display()
-            template_status_counts[status_display] = template_status_counts.get(status_display, 0) + 1
-
         if template_status_counts:
-            chart_data = [(status, count) for status, count in template_status_counts.items()]
+            chart_data = [
+                (template_status_display.get(status, status), count)
+                for status, count in template_status_counts.items()
+            ]
             chart = create_chart('pie', chart_data,
                                'Template Obligation Status',
                                '', '',
@@ -537,12 +560,12 @@ def generate_legal_visual(building, start_date, end_date):
             elements.append(Spacer(1, 0.2*inch))
 
             # Template Summary
-            pending_templates = templates.filter(status='pending').count()
-            completed_templates = templates.filter(status='completed').count()
-            overdue_templates = templates.filter(status='overdue').count()
+            pending_templates = template_status_counts.get('pending', 0)
+            completed_templates = template_status_counts.get('completed', 0)
+            overdue_templates = template_status_counts.get('overdue', 0)
 
             elements.append(create_normal_paragraph(
-                f"<b>Total Templates:</b> {templates.count()} | "
+                f"<b>Total Templates:</b> {total_templates} | "
                 f"<b>Pending:</b> {pending_templates} | "
                 f"<b>Completed:</b> {completed_templates} | "
                 f"<font color='#dc3545'><b>Overdue:</b> {overdue_templates}</font>"
@@ -550,17 +573,19 @@ def generate_legal_visual(building, start_date, end_date):
             elements.append(Spacer(1, 0.3*inch))
 
     # Chart 3: Obligation Types Distribution (from LegalObligation)
-    if obligations.exists():
+    if total_obligations:
         elements.append(create_subsection_header('Obligations by Type'))
 
-        type_counts = {}
-        for obl in obligations:
-            type_display = obl.get_obligation_type_display()
-            type_counts[type_display] = type_counts.get(type_display, 0) + 1
+        # Top 5 types, most frequent first (ties: most recent due date first)
+        top_types = [
+            (obligation_type_display.get(row['obligation_type'], row['obligation_type']), row['type_count'])
+            for row in obligations.order_by().values('obligation_type').annotate(
+                type_count=Count('id'),
+                latest=Max('due_date'),
+            ).order_by('-type_count', '-latest')[:5]
+        ]
 
-        if type_counts:
-            # Get top 5 types
-            top_types = sorted(type_counts.items(), key=lambda x: x[1], reverse=True)[:5]
+        if top_types:
             chart = create_chart('bar', top_types,
                                'Top Obligation Types',
                                'Type', 'Count',
@@ -575,10 +600,11 @@ def generate_legal_visual(building, start_date, end_date):
         completion_date__lte=end_date
     ).order_by('-completion_date')[:10]
 
-    if recent_completions.exists():
+    completions_count = recent_completions.count()
+    if completions_count:
         elements.append(create_subsection_header('Recent Completions (Report Period)'))
         elements.append(create_normal_paragraph(
-            f"<b>{recent_completions.count()}</b> obligation(s) completed during the report period."
+            f"<b>{completions_count}</b> obligation(s) completed during the report period."
         ))
         elements.append(Spacer(1, 0.1*inch))
 
@@ -601,9 +627,9 @@ def generate_unit_overview(building):
     elements.append(Spacer(1, 0.2*inch))
 
     units = Unit.objects.filter(building=building).order_by('number')
+    total_units = units.count()
 
-    if units.exists():
-        total_units = units.count()
+    if total_units:
         total_area = float(units.aggregate(Sum('area'))['area__sum'] or 0)
         avg_area = total_area / total_units if total_units > 0 else 0
 
@@ -645,10 +671,12 @@ def generate_unit_overview(building):
     return elements
 
 
-def generate_service_requests_visual(building, start_date, end_date):
+def generate_service_requests_visual(building, start_datetime, end_datetime):
     """
     Visual Service Requests - Consolidated format
     Includes: FieldRequest and FieldMgmtTechnical data
+
+    start_datetime/end_datetime are the timezone-aware report bounds computed by generate_report.
     """
     from field_mgmt.models import FieldRequest, FieldMgmtTechnical, FieldMgmtTechnicalImage
 
@@ -667,13 +695,13 @@ def generate_service_requests_visual(building, start_date, end_date):
 
     # Apply date filter
     field_requests_period = field_requests.filter(
-        created_at__gte=start_date,
-        created_at__lte=end_date
+        created_at__gte=start_datetime,
+        created_at__lte=end_datetime
     )
 
     technical_requests_period = technical_requests.filter(
-        created_at__gte=start_date,
-        created_at__lte=end_date
+        created_at__gte=start_datetime,
+        created_at__lte=end_datetime
     )
 
     total_requests = field_requests.count()
@@ -696,7 +724,7 @@ def generate_service_requests_visual(building, start_date, end_date):
     elements.append(Spacer(1, 0.3*inch))
 
     # Chart 1: Field Requests Timeline (all time)
-    if field_requests.exists():
+    if total_requests:
         elements.append(create_subsection_header('Field Requests by Caretaker'))
 
         # Group by caretaker
@@ -716,7 +744,7 @@ def generate_service_requests_visual(building, start_date, end_date):
             elements.append(Spacer(1, 0.3*inch))
 
     # Chart 2: Technical Requests by Priority
-    if technical_requests.exists():
+    if total_technical:
         elements.append(create_subsection_header('Technical Requests by Priority'))
 
         priority_counts = {}
@@ -774,18 +802,18 @@ def generate_service_requests_visual(building, start_date, end_date):
             elements.append(Spacer(1, 0.2*inch))
 
     # Additional Statistics
-    if field_requests.exists():
+    if total_requests:
         # Count items across all field requests
         total_items = sum(len(req.items) if req.items else 0 for req in field_requests)
 
         elements.append(create_subsection_header('Field Request Details'))
         elements.append(create_normal_paragraph(
-            f"<b>Total Items Requested:</b> {total_items} items across {field_requests.count()} requests"
+            f"<b>Total Items Requested:</b> {total_items} items across {total_requests} requests"
         ))
         elements.append(Spacer(1, 0.2*inch))
 
     # Technical Request Images
-    if technical_requests.exists():
+    if total_technical:
         total_images = FieldMgmtTechnicalImage.objects.filter(
             technical_request__in=technical_requests
         ).count()
@@ -0,0 +1,151 @@
+# Chart and text flowables shared by the report builders in views.py and new_visual_sections.py
+
+from contextlib import contextmanager
+from functools import lru_cache
+from io import BytesIO
+import threading
+import matplotlib
+matplotlib.use('Agg')  # Use non-GUI backend
+from matplotlib import font_manager
+from matplotlib.figure import Figure
+from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+from reportlab.lib.units import inch
+from reportlab.platypus import Paragraph, Image
+from reportlab.lib.enums import TA_JUSTIFY
+from reportlab.lib.colors import HexColor
+
+# Prevent font fallback and use DejaVu Sans (default font present on server)
+matplotlib.rcParams['font.family'] = 'DejaVu Sans'
+matplotlib.rcParams['axes.unicode_minus'] = False
+
+# Build the font list at startup so the first report doesn't pay for the font scan
+font_manager.fontManager.findfont('DejaVu Sans')
+
+# Charts share matplotlib's font and text caches, so they are drawn one at a time
+# when sections run in threads
+PYPLOT_LOCK = threading.Lock()
+
+# Figures are reused between charts instead of allocating a new figure and canvas each time
+_FIGURE_POOL = []
+
+
+@contextmanager
+def borrow_figure(figsize=(6, 4), dpi=100):
+    """Take a cleared figure of the given size from the pool, returned to it afterwards"""
+    with PYPLOT_LOCK:
+        fig = _FIGURE_POOL.pop() if _FIGURE_POOL else Figure()
+        fig.set_size_inches(figsize)
+        fig.set_dpi(dpi)
+        try:
+            yield fig
+        finally:
+            fig.clear()
+            _FIGURE_POOL.append(fig)
+
+
+def create_chart(chart_type, data, title, xlabel, ylabel, figsize=(6, 4), colors_list=None):
+    """Create matplotlib charts and return as Image"""
+    with borrow_figure(figsize) as fig:
+        ax = fig.subplots()
+
+        if chart_type == 'bar':
+            x_labels = [str(item[0])[:15] for item in data]  # Truncate long labels
+            y_values = [float(item[1]) for item in data]
+            bars = ax.bar(x_labels, y_values, color=colors_list or ['#17a2b8', '#28a745', '#ffc107', '#dc3545'])
+            ax.set_xlabel(xlabel, fontsize=10, fontweight='bold')
+            ax.set_ylabel(ylabel, fontsize=10, fontweight='bold')
+            for label in ax.get_xticklabels():
+                label.set(rotation=45, ha='right')
+
+        elif chart_type == 'line':
+            x_values = [str(item[0]) for item in data]
+            y_values = [float(item[1]) for item in data]
+            ax.plot(range(len(x_values)), y_values, marker='o', linewidth=2, markersize=6, color='#17a2b8')
+            ax.set_xticks(range(len(x_values)))
+            ax.set_xticklabels(x_values, rotation=45, ha='right')
+            ax.set_xlabel(xlabel, fontsize=10, fontweight='bold')
+            ax.set_ylabel(ylabel, fontsize=10, fontweight='bold')
+            ax.grid(True, alpha=0.3)
+
+        elif chart_type == 'pie':
+            labels = [str(item[0])[:20] for item in data]  # Truncate long labels
+            values = [float(item[1]) for item in data]
+            colors_pie = colors_list or ['#17a2b8', '#28a745', '#ffc107', '#dc3545', '#6610f2', '#e83e8c']
+            ax.pie(values, labels=labels, autopct='%1.1f%%', colors=colors_pie, startangle=90)
+            ax.axis('equal')
+
+        ax.set_title(title, fontsize=12, fontweight='bold', pad=15)
+        fig.tight_layout()
+
+        # Save to BytesIO with optimized DPI for faster generation
+        img_buffer = BytesIO()
+        fig.savefig(img_buffer, format='png', dpi=100, bbox_inches='tight')
+        img_buffer.seek(0)
+
+    return Image(img_buffer, width=4.5*inch, height=3*inch)
+
+
+@lru_cache(maxsize=None)
+def sample_style_sheet():
+    """ReportLab's sample stylesheet, built once; only used as parent of the report styles"""
+    return getSampleStyleSheet()
+
+
+@lru_cache(maxsize=None)
+def _section_header_style(color):
+    """Section header ParagraphStyle for a hex color, built once per color"""
+    return ParagraphStyle(
+        'SectionHeader',
+        parent=sample_style_sheet()['Heading1'],
+        fontSize=16,
+        textColor=HexColor(color),
+        spaceAfter=12,
+        spaceBefore=20,
+        fontName='Helvetica-Bold',
+        leftIndent=0,
+        borderPadding=8,
+        borderColor=HexColor(color),
+        borderWidth=0,
+        borderRadius=0,
+    )
+
+
+def create_section_header(text, color='#17a2b8'):
+    """Create a styled section header"""
+    return Paragraph(text, _section_header_style(color))
+
+
+SUBSECTION_HEADER_STYLE = ParagraphStyle(
+    'SubsectionHeader',
+    parent=sample_style_sheet()['Heading2'],
+    fontSize=13,
+    textColor=HexColor('#2c3e50'),
+    spaceAfter=10,
+    spaceBefore=15,
+    fontName='Helvetica-Bold',
+)
+
+
+def create_subsection_header(text):
+    """Create a styled subsection header"""
+    return Paragraph(text, SUBSECTION_HEADER_STYLE)
+
+
+@lru_cache(maxsize=None)
+def _normal_paragraph_style(alignment):
+    """Body text ParagraphStyle for an alignment, built once per alignment"""
+    return ParagraphStyle(
+        'NormalText',
+        parent=sample_style_sheet()['Normal'],
+        fontSize=10,
+        textColor=HexColor('#2c3e50'),
+        spaceAfter=8,
+        spaceBefore=4,
+        alignment=alignment,
+        leading=14,
+    )
+
+
+def create_normal_paragraph(text, alignment=TA_JUSTIFY):
+    """Create a styled normal paragraph"""
+    return Paragraph(text, _normal_paragraph_style(alignment))
@@ -77,3 +77,10 @@ class ReportJustificationUpdateSerializer(serializers.ModelSerializer):
             # Page 10
             'page10_calendar_justification',
         ]
+
+    def update(self, instance, validated_data):
+        """Write only the submitted columns (plus updated_at) in a single UPDATE"""
+        for field, value in validated_data.items():
+            setattr(instance, field, value)
+        instance.save(update_fields=[*validated_data, 'updated_at'])
+        return instance
@@ -0,0 +1,33 @@
+from django.db.models.signals import post_save, post_delete
+
+from building_mgmt.models import Building, Unit, Tower, TowerUnitDistribution
+from equipment_mgmt.models import Equipment, MaintenanceRecord
+from financials.models import (
+    Expense, Revenue, FinancialMainAccount, ExpenseEntry, RevenueAccount, AccountBalance,
+    FinancialAccountTransaction, MarketValueSetting,
+)
+from consumptions.models import ConsumptionReading, ConsumptionRegister, ConsumptionAccount
+from legal_docs.models import LegalObligation, LegalTemplate, LegalObligationCompletion
+from field_mgmt.models import FieldRequest, FieldMgmtTechnical, FieldMgmtTechnicalImage
+from .utils import invalidate_report_cache
+
+# Every model the report sections read from
+REPORT_SOURCE_MODELS = (
+    Building, Unit, Tower, TowerUnitDistribution,
+    Equipment, MaintenanceRecord,
+    Expense, Revenue, FinancialMainAccount, ExpenseEntry, RevenueAccount, AccountBalance,
+    FinancialAccountTransaction, MarketValueSetting,
+    ConsumptionReading, ConsumptionRegister, ConsumptionAccount,
+    LegalObligation, LegalTemplate, LegalObligationCompletion,
+    FieldRequest, FieldMgmtTechnical, FieldMgmtTechnicalImage,
+)
+
+
+def report_data_changed(sender, instance, **kwargs):
+    """Drop cached report PDFs when any data they were built from changes"""
+    invalidate_report_cache()
+
+
+for model in REPORT_SOURCE_MODELS:
+    post_save.connect(report_data_changed, sender=model, dispatch_uid=f'report_data_changed_save_{model._meta.label}')
+    post_delete.connect(report_data_changed, sender=model, dispatch_uid=f'report_data_changed_delete_{model._meta.label}')
@@ -0,0 +1,48 @@
+from celery import shared_task
+from django.core.files import File
+from django.core.files.storage import default_storage
+from datetime import datetime
+import logging
+import tempfile
+
+logger = logging.getLogger(__name__)
+
+
+@shared_task(bind=True, acks_late=True)
+def build_report_pdf(self, building_id, start_date, end_date, sections, conclusions):
+    """
+    Build a building report PDF in the background and save it to the default storage.
+
+    Args:
+        building_id: ID of the Building
+        start_date: Report start date in ISO format (YYYY-MM-DD)
+        end_date: Report end date in ISO format (YYYY-MM-DD)
+        sections: Dict of section name -> enabled flag, as sent to generate_report
+        conclusions: Dict of section name -> justification text
+
+    Progress is reported as a PROGRESS state with the section being assembled.
+    The saved file is recorded on the ReportTask row created by generate_report.
+    """
+    from building_mgmt.models import Building
+    from reporting.models import ReportTask
+    from reporting.views import build_report_document, report_filename
+
+    building = Building.objects.get(id=building_id)
+    start = datetime.strptime(start_date, '%Y-%m-%d').date()
+    end = datetime.strptime(end_date, '%Y-%m-%d').date()
+
+    def on_section(name):
+        self.update_state(state='PROGRESS', meta={'section': name})
+
+    filename = report_filename(building, start, end)
+
+    # Rendered to disk and copied to storage in chunks, never held in memory whole
+    with tempfile.TemporaryFile() as pdf_file:
+        build_report_document(pdf_file, building, start, end, sections, conclusions, on_section=on_section)
+        pdf_file.seek(0)
+        path = default_storage.save(f'reports/{self.request.id}/{filename}', File(pdf_file, name=filename))
+
+    ReportTask.objects.filter(task_id=self.request.id).update(report_file=path, filename=filename)
+    logger.info(f'Report for building {building_id} saved to {path}')
+
+    return {'path': path, 'filename': filename}
@@ -3,6 +3,8 @@ from . import views
 
 urlpatterns = [
     path('generate/', views.generate_report, name='generate_report'),
+    path('status/<str:task_id>/', views.report_status, name='report_status'),
+    path('download/<str:task_id>/', views.download_report, name='download_report'),
     # Report Justifications - Get all justifications for a building
     path('justifications/<int:building_id>/', views.get_report_justifications, name='get_report_justifications'),
     # Page-specific update endpoints
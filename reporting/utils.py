@@ -0,0 +1,35 @@
+from uuid import uuid4
+
+from django.core.cache import cache
+
+from building_mgmt.utils import cache_is_shared
+
+# Rendered PDFs are cached under a hash of the request and the current report data version
+REPORT_CACHE_TIMEOUT = 3600
+# Larger PDFs are only streamed from disk, never read back into memory for the cache
+REPORT_CACHE_MAX_BYTES = 2 * 1024 * 1024
+REPORT_DATA_VERSION_CACHE_KEY = 'reporting:data_version'
+
+
+def report_cache_enabled():
+    """
+    Whether rendered PDFs are cached.
+
+    Only with a shared cache backend: per-process local memory would hold a
+    copy of every PDF in each worker and miss most repeated requests.
+    """
+    return cache_is_shared()
+
+
+def get_report_data_version():
+    """
+    Opaque token that changes whenever data read by the reports changes.
+
+    Reset by the post_save/post_delete signals of those models (see signals.py).
+    """
+    return cache.get_or_set(REPORT_DATA_VERSION_CACHE_KEY, lambda: uuid4().hex, None)
+
+
+def invalidate_report_cache():
+    """Start a new report data version, orphaning every cached PDF"""
+    cache.delete(REPORT_DATA_VERSION_CACHE_KEY)
@@ -83,6 +83,7 @@ DATABASES = {
         'HOST': config('DB_HOST', default='pg-388d85e4-horiachyir-880f.d.aivencloud.com'),
         'PORT': config('DB_PORT', default='19239'),
         'CONN_MAX_AGE': 60,  # Keep connections alive for 60 seconds
+        'CONN_HEALTH_CHECKS': True,  # Reconnect if a kept-alive connection was dropped by the server
         'OPTIONS': {
             'client_encoding': 'UTF8',
             'connect_timeout': 10,  # Connection timeout in seconds
@@ -91,6 +92,24 @@ DATABASES = {
     }
 }
 
+# Cache - set CACHE_URL (e.g. redis://localhost:6379/1) to share it between worker processes;
+# without it each process keeps its own local-memory cache
+CACHE_URL = config('CACHE_URL', default='')
+
+if CACHE_URL:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': CACHE_URL,
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        }
+    }
+
 
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
@@ -239,6 +258,9 @@ CELERY_TASK_SERIALIZER = 'json'
 CELERY_RESULT_SERIALIZER = 'json'
 CELERY_TIMEZONE = TIME_ZONE
 CELERY_ENABLE_UTC = True
+# Long-running tasks (report PDFs): hand each worker process one task at a time
+CELERY_WORKER_PREFETCH_MULTIPLIER = 1
+CELERY_TASK_SOFT_TIME_LIMIT = 300
 
 # Celery Beat Configuration
 CELERY_BEAT_SCHEDULER = 'django_celery_beat.schedulers:DatabaseScheduler'
@@ -10,7 +10,13 @@ https://docs.djangoproject.com/en/5.2/howto/deployment/wsgi/
 import os
 
 from django.core.wsgi import get_wsgi_application
+from django.urls import get_resolver
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'sindipro_backend.settings')
 
 application = get_wsgi_application()
+
+# Build the URL resolver when the worker starts instead of on its first request:
+# populating the root resolver imports every include()d URLconf with its views
+# and compiles all URL patterns
+get_resolver().reverse_dict
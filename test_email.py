@@ -1,7 +1,7 @@
 #!/usr/bin/env python
 """
 Email Test Script (Gmail SMTP)
-Usage: python test_email.py recipient@email.com
+Usage: python test_email.py recipient@email.com [other@email.com ...]
 """
 
 import os
@@ -12,19 +12,22 @@ sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'sindipro_backend.settings')
 django.setup()
 
-from django.core.mail import send_mail
+from django.core.mail import EmailMessage, get_connection
 from django.conf import settings
 
-def test_email(recipient):
+def test_email(recipients):
+    # One SMTP connection for every recipient instead of a new handshake per message
     try:
-        send_mail(
-            subject='Sindipro Email Test - Success!',
-            message='Your Sindipro email configuration is working perfectly.\n\nThis is a test email from the legal notification system.',
-            from_email=settings.DEFAULT_FROM_EMAIL,
-            recipient_list=[recipient],
-            fail_silently=False,
-        )
-        print(f"✅ Email sent successfully to {recipient}")
+        with get_connection(fail_silently=False) as connection:
+            for recipient in recipients:
+                EmailMessage(
+                    subject='Sindipro Email Test - Success!',
+                    body='Your Sindipro email configuration is working perfectly.\n\nThis is a test email from the legal notification system.',
+                    from_email=settings.DEFAULT_FROM_EMAIL,
+                    to=[recipient],
+                    connection=connection,
+                ).send()
+                print(f"✅ Email sent successfully to {recipient}")
         return True
     except Exception as e:
         print(f"❌ Error: {str(e)}")
@@ -32,8 +35,8 @@ def test_email(recipient):
 
 if __name__ == "__main__":
     if len(sys.argv) < 2:
-        print("Usage: python test_email.py recipient@email.com")
+        print("Usage: python test_email.py recipient@email.com [other@email.com ...]")
         sys.exit(1)
 
-    recipient = sys.argv[1]
-    test_email(recipient)
+    recipients = sys.argv[1:]
+    test_email(recipients)
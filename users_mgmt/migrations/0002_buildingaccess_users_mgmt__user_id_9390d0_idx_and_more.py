@@ -0,0 +1,24 @@
+# Generated by Django 5.2.4 on 2026-10-16 21:05
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('building_mgmt', '0012_alter_unit_unique_together'),
+        ('users_mgmt', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='buildingaccess',
+            index=models.Index(fields=['user', 'is_active'], name='users_mgmt__user_id_9390d0_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='buildingaccess',
+            index=models.Index(fields=['building', 'is_active'], name='users_mgmt__buildin_854b53_idx'),
+        ),
+    ]
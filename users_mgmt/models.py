@@ -61,6 +61,10 @@ class BuildingAccess(models.Model):
     
     class Meta:
         unique_together = ('user', 'building')
+        indexes = [
+            models.Index(fields=['user', 'is_active']),
+            models.Index(fields=['building', 'is_active']),
+        ]
     
     def __str__(self):
         return f"{self.user.username} - {self.building.name} - {self.access_level}"
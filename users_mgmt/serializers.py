@@ -1,6 +1,6 @@
 from rest_framework import serializers
 from .models import BuildingAccess
-from building_mgmt.models import Building
+from building_mgmt.utils import get_missing_building_ids
 
 
 class BuildingAccessSerializer(serializers.ModelSerializer):
@@ -31,8 +31,7 @@ class UserBuildingAssignmentSerializer(serializers.Serializer):
 
     def validate_building_ids(self, value):
         """Validate that all building IDs exist"""
-        existing_ids = set(Building.objects.filter(id__in=value).values_list('id', flat=True))
-        invalid_ids = set(value) - existing_ids
+        invalid_ids = get_missing_building_ids(value)
         if invalid_ids:
             raise serializers.ValidationError(f"Buildings with IDs {invalid_ids} do not exist.")
         return value
@@ -2,6 +2,7 @@ from rest_framework import generics, status, permissions
 from rest_framework.response import Response
 from rest_framework.views import APIView
 from django.contrib.auth import get_user_model
+from django.db import transaction, IntegrityError
 from auth_system.serializers import UserSerializer
 from .models import BuildingAccess
 from .serializers import BuildingAccessSerializer, UserBuildingAssignmentSerializer
@@ -10,6 +11,14 @@ from building_mgmt.serializers import BuildingReadSerializer
 
 User = get_user_model()
 
+# Roles allowed to manage other users and their building access
+ADMIN_ROLES = frozenset({'master', 'manager'})
+
+
+def user_is_admin(user):
+    """Whether the user has a master or manager role"""
+    return user.role in ADMIN_ROLES
+
 
 class UserUpdateDestroyView(generics.RetrieveUpdateDestroyAPIView):
     """
@@ -28,7 +37,7 @@ class UserUpdateDestroyView(generics.RetrieveUpdateDestroyAPIView):
         Restrict access based on user role.
         Only master and manager roles can modify other users.
         """
-        if self.request.user.role in ['master', 'manager']:
+        if user_is_admin(self.request.user):
             return User.objects.all()
         # Regular users can only access their own data
         return User.objects.filter(id=self.request.user.id)
@@ -39,15 +48,16 @@ class UserUpdateDestroyView(generics.RetrieveUpdateDestroyAPIView):
         Validates that only authorized users can update other users.
         """
         partial = kwargs.pop('partial', False)
-        instance = self.get_object()
 
-        # Check permission - users can only edit themselves unless they're master/manager
-        if instance.id != request.user.id and request.user.role not in ['master', 'manager']:
+        # Check permission before fetching - users can only edit themselves unless they're master/manager
+        if kwargs['pk'] != request.user.id and not user_is_admin(request.user):
             return Response(
                 {"errors": {"permission": "You do not have permission to edit this user."}},
                 status=status.HTTP_403_FORBIDDEN
             )
 
+        instance = self.get_object()
+
         serializer = self.get_serializer(instance, data=request.data, partial=partial)
 
         if not serializer.is_valid():
@@ -70,22 +80,22 @@ class UserUpdateDestroyView(generics.RetrieveUpdateDestroyAPIView):
         Only master and manager roles can delete users.
         Users cannot delete themselves.
         """
-        instance = self.get_object()
-
-        # Check permission - only master/manager can delete users
-        if request.user.role not in ['master', 'manager']:
+        # Check permission before fetching - only master/manager can delete users
+        if not user_is_admin(request.user):
             return Response(
                 {"errors": {"permission": "You do not have permission to delete users."}},
                 status=status.HTTP_403_FORBIDDEN
             )
 
         # Prevent users from deleting themselves
-        if instance.id == request.user.id:
+        if kwargs['pk'] == request.user.id:
             return Response(
                 {"errors": {"permission": "You cannot delete your own account."}},
                 status=status.HTTP_400_BAD_REQUEST
             )
 
+        instance = self.get_object()
+
         # Perform the deletion
         self.perform_destroy(instance)
 
@@ -115,7 +125,7 @@ class UserBuildingAccessView(APIView):
             )
 
         # Check permission - users can only see their own buildings unless they're master/manager
-        if user.id != request.user.id and request.user.role not in ['master', 'manager']:
+        if user.id != request.user.id and not user_is_admin(request.user):
             return Response(
                 {"errors": {"permission": "You do not have permission to view this user's buildings."}},
                 status=status.HTTP_403_FORBIDDEN
@@ -133,7 +143,7 @@ class UserBuildingAccessView(APIView):
     def put(self, request, pk):
         """Update buildings assigned to a user"""
         # Only master/manager can assign buildings
-        if request.user.role not in ['master', 'manager']:
+        if not user_is_admin(request.user):
             return Response(
                 {"errors": {"permission": "You do not have permission to assign buildings."}},
                 status=status.HTTP_403_FORBIDDEN
@@ -153,18 +163,27 @@ class UserBuildingAccessView(APIView):
 
         building_ids = serializer.validated_data['building_ids']
 
-        # Remove all existing building accesses for this user
-        BuildingAccess.objects.filter(user=user).delete()
-
-        # Create new building accesses
-        for building_id in building_ids:
-            building = Building.objects.get(pk=building_id)
-            BuildingAccess.objects.create(
-                user=user,
-                building=building,
-                access_level='full',
-                is_active=True,
-                granted_by=request.user
+        # Replace all existing building accesses for this user in one transaction.
+        # The serializer already checked that every building exists, so the new
+        # rows are inserted by id in a single bulk INSERT (duplicate ids collapsed);
+        # a building deleted since then fails the foreign key check
+        try:
+            with transaction.atomic():
+                BuildingAccess.objects.filter(user=user).delete()
+                BuildingAccess.objects.bulk_create([
+                    BuildingAccess(
+                        user=user,
+                        building_id=building_id,
+                        access_level='full',
+                        is_active=True,
+                        granted_by=request.user
+                    )
+                    for building_id in dict.fromkeys(building_ids)
+                ])
+        except IntegrityError:
+            return Response(
+                {"errors": {"building_ids": "One or more buildings do not exist."}},
+                status=status.HTTP_400_BAD_REQUEST
             )
 
         # Return updated list
@@ -203,16 +222,14 @@ class CurrentUserBuildingsView(APIView):
             serializer = BuildingReadSerializer(buildings, many=True)
             return Response(serializer.data, status=status.HTTP_200_OK)
 
-        # manager, operator and other roles: only see assigned buildings
-        building_accesses = BuildingAccess.objects.filter(
-            user=user,
-            is_active=True
+        # manager, operator and other roles: only see assigned buildings,
+        # queried as buildings directly instead of unwrapping BuildingAccess rows
+        buildings = Building.objects.filter(
+            user_access__user=user,
+            user_access__is_active=True
         ).select_related(
-            'building',
-            'building__address',
-            'building__alternative_address'
-        ).prefetch_related('building__towers__unit_distribution')
+            'address', 'alternative_address'
+        ).prefetch_related('towers__unit_distribution')
 
-        buildings = [ba.building for ba in building_accesses]
         serializer = BuildingReadSerializer(buildings, many=True)
         return Response(serializer.data, status=status.HTTP_200_OK)